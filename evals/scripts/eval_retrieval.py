@@ -4,7 +4,7 @@ import time
 from datetime import datetime
 from typing import List, Dict, Any
 
-from ai_waiter_core.tools.search.hybrid_retriever import RetrieverManager
+from ai_waiter_core.agent.tools.search.hybrid_retriever import RetrieverManager
 from ai_waiter_core.config import settings
 
 # Paths
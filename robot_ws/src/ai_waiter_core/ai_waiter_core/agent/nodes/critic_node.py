@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import Dict, Any
 
 from langchain_ollama import ChatOllama
@@ -11,6 +10,16 @@ from ai_waiter_core.schemas.reflection import CriticVerdict
 # Resolved path from centralized config settings
 SKILL_PATH = settings.resources_dir / "skills" / "menu_grounding.md"
 
+def _load_grounding_skill() -> str:
+    """Read the grounding skill once and inject the (static) menu list."""
+    with open(SKILL_PATH, 'r', encoding='utf-8') as f:
+        grounding_skill_template = f.read()
+
+    menu_list_str = "\n".join(f"- {name}" for name in MENU_NAMES)
+    return grounding_skill_template.format(menu_list=menu_list_str)
+
+_GROUNDING_SKILL = _load_grounding_skill()
+
 # Initialize structured critic LLM self-containedly
 _critic_model = ChatOllama(
     model=settings.WORKER_MODEL,
@@ -30,20 +39,13 @@ def critic_node(state: AgentState) -> Dict[str, Any]:
     if not hasattr(last_message, "tool_calls") or not last_message.tool_calls:
         return {"is_valid": True, "feedback": None}
     
-    # 2. Load Grounding Skill Plugin and Inject Active Menu
-    with open(SKILL_PATH, 'r', encoding='utf-8') as f:
-        grounding_skill_template = f.read()
-    
-    menu_list_str = "\n".join([f"- {name}" for name in MENU_NAMES])
-    grounding_skill = grounding_skill_template.format(menu_list=menu_list_str)
-    
-    # 3. Format qualitative audit prompt
+    # 2. Format qualitative audit prompt
     prompt = f"Review these tool calls and verify item names against the menu:\n{last_message.tool_calls}"
     
-    # 4. Invoke Structured Critic LLM
+    # 3. Invoke Structured Critic LLM
     try:
         verdict: CriticVerdict = _critic_model.invoke([
-            {"role": "system", "content": grounding_skill},
+            {"role": "system", "content": _GROUNDING_SKILL},
             {"role": "user", "content": prompt}
         ])
         
@@ -3,15 +3,12 @@ from typing import Dict, Any
 
 from langchain_core.messages import HumanMessage
 from ai_waiter_core.agent.state import AgentState
-from ai_waiter_core.agent.nodes.semantic_router_node import SemanticRouterNode
+from ai_waiter_core.agent.nodes.semantic_router_node import get_semantic_router
 from ai_waiter_core.agent.nodes.slm_router_node import slm_router_node
 from ai_waiter_core.utils import trace_latency
 
 logger = logging.getLogger(__name__)
 
-# Pre-instantiate globally to avoid loading embeddings on every turn
-_semantic_router_instance = None
-
 # Confidence threshold for fast-tracking. Lowered to 0.75 to catch ORDER queries
 # with specific menu item names that previously fell below 0.82.
 HYBRID_CONFIDENCE_THRESHOLD = 0.75
@@ -54,17 +51,13 @@ def hybrid_router_node(state: AgentState) -> Dict[str, Any]:
     
     Returns routing_meta with confidence score and which engine decided.
     """
-    global _semantic_router_instance
-    if _semantic_router_instance is None:
-        _semantic_router_instance = SemanticRouterNode()
-        
     last_user_message = next(
         (m.content for m in reversed(state["messages"]) if isinstance(m, HumanMessage)), 
         ""
     )
     
     # 1. Try Fast Semantic Routing
-    semantic_result = _semantic_router_instance.route(last_user_message)
+    semantic_result = get_semantic_router().route(last_user_message)
     sem_intent = semantic_result.get("raw_intent")
     sem_confidence = semantic_result.get("confidence", 0.0)
     
@@ -44,18 +44,19 @@ _llm = ChatOllama(
 _order_prompt = _build_order_prompt()
 _order_chain = _order_prompt | _llm
 
+# The menu is static for the lifetime of the process, so format it once
+_MENU_STR = "\n".join(f"- {name}" for name in MENU_NAMES)
+
 # ------------------------------------------------------------
 # Context Builder Helper
 # ------------------------------------------------------------
 
 def _build_context_block(state: AgentState) -> str:
     """Cleanly assembles dynamic context without messy string concatenation."""
-    menu_str = "\n".join([f"- {name}" for name in MENU_NAMES])
-    
     blocks = [
         "### RESTAURANT MENU:",
         "You must strictly match items to these exact names:",
-        menu_str
+        _MENU_STR
     ]
     
     if state.get("feedback"):
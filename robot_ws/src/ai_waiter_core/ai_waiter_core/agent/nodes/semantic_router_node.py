@@ -3,7 +3,6 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, Any
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from ai_waiter_core.agent.state import AgentState
 from ai_waiter_core.config import settings
@@ -20,25 +19,35 @@ class SemanticRouterNode:
         with open(path, "r", encoding="utf-8") as f:
             self.routes = json.load(f)
         
-        self.route_embeddings = {}
+        # Struct-of-arrays: every utterance embedding in one (N, d) matrix,
+        # with the route of each row in a parallel label list
+        self.route_matrix = None
+        self.route_labels = []
         self._encode_all_routes()
 
     def _encode_all_routes(self):
         log_struct("Encoding semantic router utterances", route_count=len(self.routes))
+        all_utterances = []
         for route_name, utterances in self.routes.items():
-            self.route_embeddings[route_name] = self.model.encode(utterances)
+            all_utterances.extend(utterances)
+            self.route_labels.extend([route_name] * len(utterances))
+
+        # One encode call fills the whole matrix: no per-route arrays to stack
+        self.route_matrix = self.model.encode(
+            all_utterances,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            batch_size=settings.EMBEDDING_BATCH_SIZE
+        ).astype(np.float32, copy=False)
 
     def route(self, query: str) -> Dict[str, Any]:
-        query_vec = self.model.encode([query])
-        best_route = None
-        max_sim = -1.0
-        
-        for route_name, embeddings in self.route_embeddings.items():
-            similarities = cosine_similarity(query_vec, embeddings)[0]
-            current_max = np.max(similarities)
-            if current_max > max_sim:
-                max_sim = current_max
-                best_route = route_name
+        # Embeddings are unit-length, so a dot product is the cosine similarity
+        query_vec = self.model.encode(query, normalize_embeddings=True)
+        similarities = self.route_matrix @ query_vec
+
+        best_idx = int(np.argmax(similarities))
+        best_route = self.route_labels[best_idx]
+        max_sim = similarities[best_idx]
         
         return {
             "intent": best_route if max_sim >= self.threshold else None,
@@ -49,22 +58,29 @@ class SemanticRouterNode:
 # Pre-instantiate the router class once globally to prevent reloading models on every query
 _router_instance = None
 
-@trace_latency("Semantic Router Node", run_type="chain")
-def semantic_router_node(state: AgentState) -> Dict[str, Any]:
+def get_semantic_router() -> SemanticRouterNode:
     """
-    LangGraph node that performs legacy vector-based intent classification.
+    Returns the process-wide SemanticRouterNode, creating it on first use.
+    Every node that needs semantic routing shares this instance so the
+    embedding model is only loaded (and held in VRAM) once.
     """
     global _router_instance
     if _router_instance is None:
         _router_instance = SemanticRouterNode()
-        
+    return _router_instance
+
+@trace_latency("Semantic Router Node", run_type="chain")
+def semantic_router_node(state: AgentState) -> Dict[str, Any]:
+    """
+    LangGraph node that performs legacy vector-based intent classification.
+    """
     from langchain_core.messages import HumanMessage
     last_user_message = next(
         (m.content for m in reversed(state["messages"]) if isinstance(m, HumanMessage)), 
         ""
     )
     
-    routing_result = _router_instance.route(last_user_message)
+    routing_result = get_semantic_router().route(last_user_message)
     return {
         "metadata": routing_result
     }
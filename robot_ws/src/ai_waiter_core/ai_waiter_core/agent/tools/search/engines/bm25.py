@@ -1,8 +1,8 @@
 import os 
 import pickle 
-import math
 from typing import List, Tuple
 
+import numpy as np
 from langchain_core.documents import Document
 from rank_bm25 import BM25Okapi
 import underthesea
@@ -122,15 +122,15 @@ class BM25Index(SearchIndex):
             tokenized_query = underthesea.word_tokenize(query.lower(), format="text").split()
             scores = self.bm25.get_scores(tokenized_query)
 
-
-            # Get top-k
-            doc_scores = []
-            for idx, score in enumerate(scores):
-                doc_scores.append((self.documents[idx], float(score)))
-            doc_scores.sort(key=lambda x: x[1], reverse=True)
+            # Get top-k: stable sort so tied scores keep document order (RRF
+            # fuses by rank, and zero-score ties do reach the final results)
+            top_idx = np.argsort(-scores, kind="stable")[:k]
 
             # Return 
-            return doc_scores[:k]
+            return [
+                (self.documents[idx], score)
+                for idx, score in zip(top_idx.tolist(), scores[top_idx].tolist())
+            ]
         except Exception as e:
             logger.error(f'[ERROR] Searching BM25 index: {e}')
             return []
@@ -1,10 +1,14 @@
 import json 
 import os 
+import re
 from langchain_core.documents import Document
 from ai_waiter_core.config import settings
 from ai_waiter_core.utils import logger
 
 
+# "## Title" line followed by everything up to the next "##" heading
+SECTION_RE = re.compile(r'^##[ \t]*(.+?)[ \t]*$\n?(.*?)(?=^##|\Z)', re.M | re.S)
+
 
 class DocumentLoader: 
     def __init__(self): 
@@ -102,21 +106,13 @@ class DocumentLoader:
         with open(file_path, 'r', encoding='utf-8') as f: 
             content = f.read()
 
-        # Split content by ## section
-        sections = content.split('##')
         documents = [] 
-        for section in sections: 
-            if not section.strip(): 
-                continue
-
-            # Split section into title and content
-            parts = section.split('\n', 1)
-            if len(parts) < 2: 
+        for match in SECTION_RE.finditer(content): 
+            title = match.group(1)
+            body = match.group(2).strip()
+            if not body: 
                 continue
 
-            title = parts[0].strip()
-            content = parts[1].strip()
-
             # Create metadata
             metadata = {
                 "source": "restaurant_info.txt",
@@ -127,7 +123,7 @@ class DocumentLoader:
             # Create a Document object
             documents.append(
                 Document(
-                    page_content=content,
+                    page_content=body,
                     metadata=metadata,
                 )
             )
@@ -1,7 +1,38 @@
+import torch
 from langchain_huggingface import HuggingFaceEmbeddings
+from ai_waiter_core.config import settings
+
+# Loaded once per process so every VectorStore shares the same encoder weights
+_embedding_model = None
 
 def get_embedding_model(): 
-    return HuggingFaceEmbeddings(
-        model_name= 'AITeamVN/Vietnamese_Embedding'
+    global _embedding_model
+    if _embedding_model is None:
+        _embedding_model = HuggingFaceEmbeddings(
+            model_name= 'AITeamVN/Vietnamese_Embedding',
+            model_kwargs=_backend_kwargs(),
+            encode_kwargs={"batch_size": settings.EMBEDDING_BATCH_SIZE}
+        )
+    return _embedding_model
+
+def _backend_kwargs() -> dict:
+    """
+    SentenceTransformer arguments for the configured device and runtime.
+    With "onnx" the encoder runs on ONNX Runtime; pointing EMBEDDING_ONNX_FILE
+    at a dynamically int8-quantized export uses the VNNI int8 kernels on CPU.
+    """
+    # Same device as the router encoder, falling back to CPU on hosts without CUDA
+    device = settings.DEVICE if torch.cuda.is_available() else "cpu"
+    kwargs = {"device": device}
+
+    backend = settings.EMBEDDING_BACKEND.lower()
+    if backend == "torch":
+        if device.startswith("cuda"):
+            # FP16 halves weight/activation bandwidth at negligible retrieval cost
+            kwargs["model_kwargs"] = {"torch_dtype": torch.float16}
+        return kwargs
 
-    )
\ No newline at end of file
+    kwargs["backend"] = backend
+    if settings.EMBEDDING_ONNX_FILE:
+        kwargs["model_kwargs"] = {"file_name": settings.EMBEDDING_ONNX_FILE}
+    return kwargs
@@ -1,21 +1,61 @@
+import hashlib
+import json
+import math
 import os 
-from typing import List, Tuple
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import faiss
+import numpy as np
 
 # langchain 
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 
 
+from ai_waiter_core.config import settings
 from ai_waiter_core.utils import logger
 from .embedding import get_embedding_model
 from .base import SearchIndex
 
+# FAISS defaults to every core; cap it so searches stay on one socket and
+# do not oversubscribe the CPU alongside the encoder and ROS executors
+faiss.omp_set_num_threads(settings.FAISS_NUM_THREADS or max(1, min(8, (os.cpu_count() or 2) // 2)))
+
+# Below this size an exact flat scan is faster than walking an HNSW graph
+HNSW_MIN_DOCUMENTS = 512
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 32
+
+# Very large corpora switch to IVF-PQ: ~M bytes per vector, only nprobe clusters scanned
+IVFPQ_MIN_DOCUMENTS = 100_000
+IVFPQ_M = 16
+IVFPQ_NBITS = 8
+IVFPQ_NPROBE = 16
+
+# Repeated queries (exact text, same k) skip the encoder; least recently used entries are evicted
+QUERY_CACHE_MAX_ENTRIES = 1024
+
+# Hash of the inputs of the saved index, used to skip re-embedding unchanged data
+FINGERPRINT_FILE = "fingerprint.txt"
+
 class VectorStore(SearchIndex):
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, quantization: str = None):
         self.db_path = db_path
+        self.quantization = (quantization or settings.VECTOR_QUANTIZATION).lower()
         self.vector_db = None
+        self.nprobe = IVFPQ_NPROBE
         self.embedding = get_embedding_model()
+        # Index used for searching: vector_db.index itself, or its GPU mirror
+        self._search_index = None
+        self._gpu_resources = None
         os.makedirs(self.db_path, exist_ok=True)
+
+        self._query_cache_lock = threading.Lock()
+        self._reset_query_cache()
     
     def build(self, documents: List[Document]) -> bool:
         """
@@ -26,20 +66,115 @@ class VectorStore(SearchIndex):
             bool: True if index was built successfully, False otherwise
         """
         try:
-            self.vector_db = FAISS.from_documents(documents, self.embedding)
+            fingerprint = self._fingerprint(documents)
+            if self._read_fingerprint() == fingerprint and self.load():
+                logger.info('[INFO] Vector store unchanged, reusing saved index')
+                return True
+
+            self.vector_db = self._build_index(documents)
+            self._prepare_search_index()
             self.vector_db.save_local(self.db_path)
+            self._write_fingerprint(fingerprint)
             logger.info(f'[INFO] Vector store saved to {self.db_path}')
             return True
         except Exception as e:
             logger.error(f'[ERROR] Creating vector store: {e}')
             return False
     
+    def _build_index(self, documents: List[Document]) -> FAISS:
+        """
+        Embed documents and add them to a FAISS index sized for the corpus
+        Args:
+            documents (List[Document]): List of documents to index
+        Returns:
+            FAISS: LangChain vector store wrapping the new index
+        """
+        texts = [doc.page_content for doc in documents]
+        embeddings = self.embedding.embed_documents(texts)
+
+        index = self._create_index(len(embeddings[0]), len(embeddings))
+        if not index.is_trained:
+            # Scalar quantizers learn per-dimension value ranges, IVF-PQ its centroids and codebooks
+            index.train(np.asarray(embeddings, dtype=np.float32))
+
+        vector_db = FAISS(
+            embedding_function=self.embedding,
+            index=index,
+            docstore=InMemoryDocstore(),
+            index_to_docstore_id={}
+        )
+        vector_db.add_embeddings(zip(texts, embeddings), metadatas=[doc.metadata for doc in documents])
+        return vector_db
+
+    def _create_index(self, dimension: int, num_documents: int) -> faiss.Index:
+        """
+        Pick the FAISS index type for the corpus size and quantization.
+        Small menus keep the exact flat scan, larger corpora use HNSW and
+        very large ones IVF-PQ (already compressed, so it ignores quantization).
+        With "int8" quantization vectors are stored as 8-bit codes (4x smaller)
+        and queries stay float32. All variants use L2 distance, so scores stay
+        comparable with existing indexes.
+        """
+        use_int8 = self.quantization == "int8"
+
+        # PQ splits each vector into IVFPQ_M sub-vectors, so the dimension must divide evenly
+        if num_documents >= IVFPQ_MIN_DOCUMENTS and dimension % IVFPQ_M == 0:
+            nlist = int(4 * math.sqrt(num_documents))
+            quantizer = faiss.IndexFlatL2(dimension)
+            return faiss.IndexIVFPQ(quantizer, dimension, nlist, IVFPQ_M, IVFPQ_NBITS, faiss.METRIC_L2)
+
+        if num_documents < HNSW_MIN_DOCUMENTS:
+            if use_int8:
+                return faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+            return faiss.IndexFlatL2(dimension)
+
+        if use_int8:
+            index = faiss.IndexHNSWSQ(dimension, faiss.ScalarQuantizer.QT_8bit, HNSW_M)
+        else:
+            index = faiss.IndexHNSWFlat(dimension, HNSW_M)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+        return index
+
+    def _fingerprint(self, documents: List[Document]) -> str:
+        """
+        Hash everything that determines the index contents:
+        embedding model and runtime, quantization, index tier parameters,
+        document text and metadata
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        # The device does not change the vectors, the runtime backend can
+        runtime = {k: v for k, v in getattr(self.embedding, 'model_kwargs', {}).items() if k != "device"}
+        model_id = f"{getattr(self.embedding, 'model_name', '')}|{runtime}"
+        # Build-time index parameters (nprobe is applied at load, so it is not included)
+        index_params = (
+            HNSW_MIN_DOCUMENTS, HNSW_M, HNSW_EF_CONSTRUCTION, HNSW_EF_SEARCH,
+            IVFPQ_MIN_DOCUMENTS, IVFPQ_M, IVFPQ_NBITS,
+        )
+        digest.update(f"{model_id}|{self.quantization}|{index_params}".encode("utf-8"))
+        for doc in documents:
+            digest.update(b"\0" + doc.page_content.encode("utf-8"))
+            digest.update(b"\0" + json.dumps(doc.metadata, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _read_fingerprint(self) -> Optional[str]:
+        path = os.path.join(self.db_path, FINGERPRINT_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+
+    def _write_fingerprint(self, fingerprint: str):
+        with open(os.path.join(self.db_path, FINGERPRINT_FILE), 'w', encoding='utf-8') as f:
+            f.write(fingerprint)
+
     def load(self) -> bool:
         """
         Load vector store from disk
         """
         try:
             self.vector_db = FAISS.load_local(self.db_path, self.embedding, allow_dangerous_deserialization=True)
+            self._prepare_search_index()
             logger.info(f'[INFO] Vector store loaded from {self.db_path}')
             return True
 
@@ -47,6 +182,41 @@ class VectorStore(SearchIndex):
             logger.error(f'[ERROR] Loading vector store: {e}')
             return False
     
+    def set_nprobe(self, nprobe: int):
+        """
+        Set how many IVF clusters each query scans (higher = better recall, slower).
+        Takes effect immediately, no rebuild needed; ignored for non-IVF indexes.
+        """
+        self.nprobe = nprobe
+        if self.vector_db is not None and isinstance(self.vector_db.index, faiss.IndexIVF):
+            self._prepare_search_index()
+
+    def _prepare_search_index(self):
+        """
+        Apply search parameters and pick the index queries run against.
+        With faiss-gpu and a CUDA device the index is mirrored on the GPU;
+        the CPU index stays the one that is added to and saved.
+        """
+        index = self.vector_db.index
+        if isinstance(index, faiss.IndexIVF):
+            index.nprobe = self.nprobe
+        self._search_index = index
+        self._reset_query_cache()
+
+        if not settings.DEVICE.startswith("cuda") or not hasattr(faiss, "StandardGpuResources"):
+            return
+        if faiss.get_num_gpus() == 0:
+            return
+
+        try:
+            if self._gpu_resources is None:
+                self._gpu_resources = faiss.StandardGpuResources()
+            device_id = int(settings.DEVICE.split(":")[1]) if ":" in settings.DEVICE else 0
+            self._search_index = faiss.index_cpu_to_gpu(self._gpu_resources, device_id, index)
+        except Exception as e:
+            # e.g. HNSW has no GPU implementation
+            logger.warning(f"Vector index stays on CPU: {e}")
+
     def search(self, query: str, k: int = 4) -> List[Tuple[Document, float]]:
         """
         Search vector store for query
@@ -57,10 +227,56 @@ class VectorStore(SearchIndex):
             List[Tuple[Document, float (0 -1)]]: List of documents and their scores
         """
         try:
-            results = self.vector_db.similarity_search_with_score(query, k=k)
+            cache_key = (query, k)
+            cached = self._get_cached_results(cache_key)
+            if cached is not None:
+                return cached
+
+            embedding = self.embedding.embed_query(query)
+            results = self._search_index_vector(np.array([embedding], dtype=np.float32), k)
+            self._cache_results(cache_key, results)
             return results
         except Exception as e:
             logger.error(f'[ERROR] Searching vector store: {e}')
             return []
-    
-    
+
+    def _search_index_vector(self, query: np.ndarray, k: int) -> List[Tuple[Document, float]]:
+        """
+        Search the active index (CPU or its GPU mirror) with a (1, d) query embedding
+        """
+        distances, ids = self._search_index.search(query, k)
+
+        docstore = self.vector_db.docstore
+        index_to_id = self.vector_db.index_to_docstore_id
+        return [
+            (docstore.search(index_to_id[idx]), distance)
+            for idx, distance in zip(ids[0].tolist(), distances[0].tolist())
+            if idx != -1
+        ]
+
+    def _reset_query_cache(self):
+        """
+        Drop all cached query results (the index they came from changed)
+        """
+        with self._query_cache_lock:
+            self._query_cache = OrderedDict()
+
+    def _get_cached_results(self, cache_key: Tuple[str, int]) -> Optional[List[Tuple[Document, float]]]:
+        """
+        Return cached results for the same query text and k, if any
+        """
+        with self._query_cache_lock:
+            results = self._query_cache.get(cache_key)
+            if results is None:
+                return None
+            self._query_cache.move_to_end(cache_key)
+            return list(results)
+
+    def _cache_results(self, cache_key: Tuple[str, int], results: List[Tuple[Document, float]]):
+        """
+        Store results for a query, evicting the least recently used entry when full
+        """
+        with self._query_cache_lock:
+            self._query_cache[cache_key] = list(results)
+            if len(self._query_cache) > QUERY_CACHE_MAX_ENTRIES:
+                self._query_cache.popitem(last=False)
@@ -24,6 +24,8 @@ class RetrieverManager:
 
         self.is_ready = False 
         self._documents= [] 
+        # Bumped whenever the indexed documents change, so callers can key caches on it
+        self.generation = 0
 
     # Load directory
     def load_directory(self, directory_path: str) -> List[Document]:
@@ -72,6 +74,7 @@ class RetrieverManager:
         # Build search engines with the combined document list
         if self.vector_engine.build(self._documents) and self.bm25_engine.build(self._documents):
             self.is_ready = True 
+            self.generation += 1
             logger.info("[INFO] Database built successfully")
             return True 
 
@@ -121,10 +124,11 @@ class RetrieverManager:
         """
         bm25 = self.bm25_engine.search(query, k=k)
         vector = self.vector_engine.search(query, k=k)
-        
-        # Convert FAISS distance to 0-1 similarity score
-        vector_norm = [(doc, normalize_vector_score(s)) for doc, s in vector]
-        return bm25, vector_norm
+        return bm25, self._normalize_vector_results(vector)
+
+    def _normalize_vector_results(self, vector: List[Tuple[Document, float]]) -> List[Tuple[Document, float]]:
+        """ Convert FAISS distance to 0-1 similarity score """
+        return [(doc, normalize_vector_score(s)) for doc, s in vector]
 
     # --- 3. Utilities ---
 
@@ -132,5 +136,6 @@ class RetrieverManager:
         logger.info("[INFO] Loading database from disk...")
         if self.vector_engine.load() and self.bm25_engine.load():
             self.is_ready = True 
+            self.generation += 1
             return True 
         return False
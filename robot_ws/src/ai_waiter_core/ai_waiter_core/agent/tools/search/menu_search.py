@@ -1,3 +1,7 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 from langchain_core.tools import tool
 from .hybrid_retriever import RetrieverManager
 
@@ -5,6 +9,12 @@ from .hybrid_retriever import RetrieverManager
 retriever = RetrieverManager()
 retriever.load_database()
 
+# Exact-match LRU of formatted tool output, keyed by a hash of the normalized query
+# and the retriever generation (entries from before a rebuild/add never match)
+CONTEXT_CACHE_MAX_ENTRIES = 512
+_context_cache = OrderedDict()
+_context_cache_lock = threading.Lock()
+
 from pydantic import BaseModel, Field
 
 class SearchMenuInput(BaseModel):
@@ -19,8 +29,22 @@ def search_menu(query: str) -> str:
     Search the restaurant menu for food, drinks, prices, and ingredients.
     Use this for discovery and general questions about what we serve.
     """
-    results = retriever.hybrid_search(query, k=3)
+    normalized = " ".join(query.lower().split())
+    cache_key = (retriever.generation, hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest())
+    with _context_cache_lock:
+        context = _context_cache.get(cache_key)
+        if context is not None:
+            _context_cache.move_to_end(cache_key)
+            return context
+
+    # Search the normalized text so the cached output depends only on the cache key
+    results = retriever.hybrid_search(normalized, k=3)
     if not results:
         return "No matching menu items found. Please try a different keywords."
     
-    return "\n---\n".join([f"[{r.doc_type}] {r.document.page_content}" for r in results])
+    context = "\n---\n".join([f"[{r.doc_type}] {r.document.page_content}" for r in results])
+    with _context_cache_lock:
+        _context_cache[cache_key] = context
+        if len(_context_cache) > CONTEXT_CACHE_MAX_ENTRIES:
+            _context_cache.popitem(last=False)
+    return context
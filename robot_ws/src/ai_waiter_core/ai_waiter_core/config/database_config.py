@@ -1,7 +1,11 @@
 from pathlib import Path
+from pydantic import Field
 from .base_settings import BaseSystemSettings
 
 class DatabaseSettings(BaseSystemSettings):
+    # "fp32" keeps full-precision vectors, "int8" stores them scalar-quantized
+    VECTOR_QUANTIZATION: str = Field(default="fp32", env="VECTOR_QUANTIZATION")
+
     @property
     def VECTOR_DB_PATH(self) -> Path:
         return self.storage_dir / "vector" / "faiss_index"
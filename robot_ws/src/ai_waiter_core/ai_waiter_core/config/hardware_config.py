@@ -3,6 +3,14 @@ from pydantic import Field
 
 class HardwareSettings(BaseSettings):
     DEVICE: str = Field(default="cuda", env="DEVICE")
+    # Retrieval encoder runtime: "torch", or a sentence-transformers backend ("onnx", "openvino")
+    EMBEDDING_BACKEND: str = Field(default="torch", env="EMBEDDING_BACKEND")
+    # Optional exported graph inside the model repo, e.g. "onnx/model_qint8_avx512_vnni.onnx"
+    EMBEDDING_ONNX_FILE: str = Field(default="", env="EMBEDDING_ONNX_FILE")
+    # Texts per encoder forward pass when embedding documents
+    EMBEDDING_BATCH_SIZE: int = Field(default=256, env="EMBEDDING_BATCH_SIZE")
+    # OpenMP threads for FAISS search; 0 = one socket's worth, min(8, cpu_count // 2)
+    FAISS_NUM_THREADS: int = Field(default=0, env="FAISS_NUM_THREADS")
     
     model_config = SettingsConfigDict(
         env_file=".env", 
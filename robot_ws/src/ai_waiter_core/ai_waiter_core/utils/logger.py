@@ -1,5 +1,7 @@
-from huggingface_hub.utils import logging
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 # Silence third-party lib noise 
 logging.getLogger("huggingface_hub").setLevel(logging.WARNING)
@@ -7,10 +9,18 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("faiss").setLevel(logging.WARNING)
 logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 
+# Records are written to the terminal by a background listener thread,
+# so a slow stdout never blocks the agent loop that emits them
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='[%(levelname)s] [%(name)s]: %(message)s'
+    format='[%(levelname)s] [%(name)s]: %(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
 
 logger = logging.getLogger("ai_waiter_core")
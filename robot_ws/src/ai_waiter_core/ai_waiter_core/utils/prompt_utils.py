@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from ai_waiter_core.config import settings
 
 def load_prompt(filename: str, sub_dir: str = "system_prompts") -> str:
@@ -13,6 +14,18 @@ def load_prompt(filename: str, sub_dir: str = "system_prompts") -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
 
+@lru_cache(maxsize=None)
+def build_worker_system_prompt(table_id: str) -> str:
+    """
+    Builds the waiter system prompt (with the hospitality skill) shared by the
+    chat, menu and payment workers. Cached per table, so the prompt files are
+    only read and formatted once.
+    Example: build_worker_system_prompt("T1")
+    """
+    system_prompt = load_prompt("waiter_agent.md").format(table_id=table_id)
+    hospitality = load_prompt("hospitality.md", "skills")
+    return f"{system_prompt}\n\n{hospitality}"
+
 def load_json_data(filename: str, sub_dir: str = "few_shots") -> list | dict:
     """
     Loads a JSON file (e.g. for few-shot examples).
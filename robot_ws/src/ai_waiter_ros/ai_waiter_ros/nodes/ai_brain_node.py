@@ -1,6 +1,12 @@
 vad = Silero_VAD() 
 asr = PhoASR(model_name= 'vinai/PhoWhisper-large')
 
+# Transient errors (a dropped audio frame, a failed decode) should not tear
+# down the loop and force the models to be reloaded. Only give up after
+# several failures in a row.
+MAX_CONSECUTIVE_FAILURES = 5
+consecutive_failures = 0
+
 is_active = True
 print("\n========================================")
 print("🤖 AI Waiter is ready to take orders.")
@@ -28,10 +34,14 @@ while is_active:
         # speak(response)
 
         print("\n--------------------------------------")
+        consecutive_failures = 0
 
     except KeyboardInterrupt:
         print("\nConversation ended by user. Shutting down.")
         is_active = False
     except Exception as e:
-        print(f"An error occurred: {e}")
-        is_active = False
+        consecutive_failures += 1
+        print(f"An error occurred ({consecutive_failures}/{MAX_CONSECUTIVE_FAILURES}): {e}")
+        if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            print("Too many consecutive errors. Shutting down.")
+            is_active = False
@@ -0,0 +1,43 @@
+import os
+import tempfile
+
+from ai_waiter_core.agent.tools.search.engines.bm25 import BM25Index
+from ai_waiter_core.agent.tools.search.engines.document_loader import DocumentLoader
+from ai_waiter_core.config import settings
+
+
+def reference_search(index: BM25Index, query: str, k: int):
+    """ Original pure-Python top-k: full stable sort by score, descending """
+    import underthesea
+    tokenized_query = underthesea.word_tokenize(query.lower(), format="text").split()
+    scores = index.bm25.get_scores(tokenized_query)
+    doc_scores = [(index.documents[idx], float(score)) for idx, score in enumerate(scores)]
+    doc_scores.sort(key=lambda x: x[1], reverse=True)
+    return doc_scores[:k]
+
+
+def run_tests():
+    data_path = settings.PROJECT_ROOT / "assets" / "data"
+    loader = DocumentLoader()
+    documents = []
+    for path in sorted(data_path.iterdir()):
+        documents.extend(loader.load(str(path)))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index = BM25Index(db_path=os.path.join(tmp_dir, "bm25.pkl"))
+        assert index.build(documents), "FAIL: BM25 build failed"
+
+    queries = ["trà", "bún", "phở bò", "giờ mở cửa", "lẩu thái hải sản", "món chay", "khuyến mãi"]
+    for query in queries:
+        for k in (1, 3, 5, 10, len(documents) + 1):
+            expected = reference_search(index, query, k)
+            actual = index.search(query, k=k)
+            assert [id(doc) for doc, _ in actual] == [id(doc) for doc, _ in expected], \
+                f"FAIL: order differs for '{query}' k={k}"
+            assert all(abs(a - e) < 1e-9 for (_, a), (_, e) in zip(actual, expected)), \
+                f"FAIL: scores differ for '{query}' k={k}"
+    print(f"PASS: BM25 top-k matches the reference sort for {len(queries)} queries")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,76 @@
+import tempfile
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from ai_waiter_core.agent.tools.search.engines import vector_db
+
+
+class FakeEmbedding(DeterministicFakeEmbedding):
+    """ Deterministic stand-in for the HuggingFace encoder that counts document encodes """
+    model_name: str = "fake-encoder"
+    model_kwargs: dict = {}
+    encode_calls: int = 0
+
+    def embed_documents(self, texts):
+        self.encode_calls += 1
+        return super().embed_documents(texts)
+
+
+def make_documents(extra: str = ""):
+    return [
+        Document(page_content=f"Món số {i}{extra}", metadata={"name": f"Món {i}", "type": "menu"})
+        for i in range(20)
+    ]
+
+
+def run_tests():
+    embedding = FakeEmbedding(size=16)
+    vector_db.get_embedding_model = lambda: embedding
+
+    with tempfile.TemporaryDirectory() as db_path:
+        def build(documents, quantization="fp32"):
+            """ Build through a fresh store, as on process start; True if the encoder ran """
+            calls = embedding.encode_calls
+            assert vector_db.VectorStore(db_path, quantization=quantization).build(documents), "FAIL: build failed"
+            return embedding.encode_calls > calls
+
+        documents = make_documents()
+        assert build(documents), "FAIL: first build did not embed"
+        assert not build(documents), "FAIL: unchanged documents were re-embedded"
+        print("PASS: unchanged build reuses the saved index")
+
+        assert build(make_documents(extra=" (mới)")), "FAIL: changed text did not rebuild"
+        assert build(documents), "FAIL: reverting the text did not rebuild"
+
+        changed_metadata = make_documents()
+        changed_metadata[0].metadata["type"] = "best_seller"
+        assert build(changed_metadata), "FAIL: changed metadata did not rebuild"
+        assert build(documents)
+        print("PASS: document text and metadata changes rebuild")
+
+        assert build(documents, quantization="int8"), "FAIL: quantization change did not rebuild"
+        assert build(documents), "FAIL: switching back to fp32 did not rebuild"
+        print("PASS: quantization change rebuilds")
+
+        embedding.model_kwargs = {"backend": "onnx"}
+        assert build(documents), "FAIL: encoder runtime change did not rebuild"
+        embedding.model_kwargs = {"backend": "onnx", "device": "cuda"}
+        assert not build(documents), "FAIL: a device-only change rebuilt the index"
+        embedding.model_kwargs = {}
+        assert build(documents)
+        print("PASS: encoder runtime change rebuilds, device change does not")
+
+        for name, value in [("HNSW_MIN_DOCUMENTS", 10), ("HNSW_M", 16), ("IVFPQ_M", 8)]:
+            original = getattr(vector_db, name)
+            setattr(vector_db, name, value)
+            try:
+                assert build(documents), f"FAIL: changing {name} did not rebuild"
+            finally:
+                setattr(vector_db, name, original)
+            assert build(documents)
+        print("PASS: index tier parameter changes rebuild")
+
+
+if __name__ == "__main__":
+    run_tests()